@@ -1,76 +1,234 @@
-from collections import deque
-from typing import Deque, Generic, TypeVar
+from typing import Generic, List, Optional, TypeVar, cast
 import threading
 import time
 from dataclasses import dataclass, field
 
 T = TypeVar('T')
 
+_UNSET = object()
+
+
+def _index_of(items: List[object], target: object) -> int:
+    # list.index() tries identity before ==, so a hit is almost always the
+    # target itself; confirm with `is` and only scan on the rare false match.
+    try:
+        start = items.index(target)
+    except ValueError:
+        return -1
+    for i in range(start, len(items)):
+        if items[i] is target:
+            return i
+    return -1
+
 @dataclass(kw_only=True)
 class BlockingQueue(Generic[T]):
     max_size: int = 10
-    
-    _queue: Deque[T] = field(init=False, repr=False)
+    # Unbounded queues never block in put(); max_size is then only the
+    # initial buffer size, and the buffer doubles whenever it fills up.
+    unbounded: bool = False
+
+    # Ring buffer: items live in _buf[_head:_head + _count], wrapping around
+    # at _cap (always max_size for bounded queues).
+    _buf: List[Optional[T]] = field(init=False, repr=False)
+    _cap: int = field(init=False, repr=False)
+    _head: int = field(init=False, repr=False)
+    _tail: int = field(init=False, repr=False)
+    _count: int = field(init=False, repr=False)
     _lock: threading.Lock = field(init=False, repr=False)
     _not_empty: threading.Condition = field(init=False, repr=False)
     _not_full: threading.Condition = field(init=False, repr=False)
-    
+    # Number of threads blocked in wait() on each condition, so put/get can
+    # skip notify() when nobody is waiting.
+    _waiting_putters: int = field(init=False, repr=False)
+    _waiting_getters: int = field(init=False, repr=False)
+
     def __post_init__(self) -> None:
         if self.max_size <= 0:
             raise ValueError("max_size must be greater than 0")
-        
-        self._queue = deque()
-        
+
+        self._buf = [None] * self.max_size
+        self._cap = self.max_size
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+
         self._lock = threading.Lock()
-        
+
         self._not_empty = threading.Condition(self._lock)
         self._not_full = threading.Condition(self._lock)
-    
+        self._waiting_putters = 0
+        self._waiting_getters = 0
+
     def put(self, item: T, timeout: float | None = None) -> None:
         with self._not_full:
-            if timeout is not None:
-                end_time = time.monotonic() + timeout
-            
-            while len(self._queue) >= self.max_size:
-                if timeout is None:
-                    self._not_full.wait()
-                else:
-                    remaining = end_time - time.monotonic()
-                    if remaining <= 0:
+            if self.unbounded:
+                if self._count == self._cap:
+                    self._grow(self._count + 1)
+            elif self._count == self.max_size:
+                self._waiting_putters += 1
+                try:
+                    if not self._not_full.wait_for(self._has_space, timeout):
                         raise TimeoutError("put() timed out waiting for space in the queue")
-                    self._not_full.wait(timeout=remaining)
-            self._queue.append(item)
-            
-            self._not_empty.notify()
-    
+                finally:
+                    self._waiting_putters -= 1
+            self._buf[self._tail] = item
+            self._tail += 1
+            if self._tail == self._cap:
+                self._tail = 0
+            self._count += 1
+
+            if self._waiting_getters:
+                self._not_empty.notify()
+
     def get(self, timeout: float | None = None) -> T:
         with self._not_empty:
+            if self._count == 0:
+                self._waiting_getters += 1
+                try:
+                    if not self._not_empty.wait_for(self._has_items, timeout):
+                        raise TimeoutError("get() timed out waiting for item")
+                finally:
+                    self._waiting_getters -= 1
+            item = cast(T, self._buf[self._head])
+            self._buf[self._head] = None
+            self._head += 1
+            if self._head == self._cap:
+                self._head = 0
+            self._count -= 1
+            if self._waiting_putters:
+                self._not_full.notify()
+            return item
+
+    def put_many(self, items: List[T], timeout: float | None = None) -> None:
+        with self._not_full:
             if timeout is not None:
                 end_time = time.monotonic() + timeout
-                
-            while len(self._queue) == 0:
-                if timeout is None:
-                    self._not_empty.wait()
+
+            bounded = not self.unbounded
+            if not bounded and self._count + len(items) > self._cap:
+                self._grow(self._count + len(items))
+
+            # Not atomic: items are enqueued in order as space frees up, so a
+            # timeout leaves the first `start` items in the queue.
+            n = len(items)
+            start = 0
+            while start < n:
+                if bounded and self._count == self.max_size:
+                    # Let consumers drain what has been added so far.
+                    if self._waiting_getters:
+                        self._not_empty.notify_all()
+                    remaining = None if timeout is None else end_time - time.monotonic()
+                    self._waiting_putters += 1
+                    try:
+                        if not self._not_full.wait_for(self._has_space, remaining):
+                            raise TimeoutError(
+                                f"put_many() timed out waiting for space in the queue "
+                                f"after enqueuing {start} of {n} items"
+                            )
+                    finally:
+                        self._waiting_putters -= 1
+
+                # Copy as many items as fit with at most two slice assignments,
+                # splitting where the ring wraps around.
+                k = min(n - start, self._cap - self._count)
+                tail = self._tail
+                first = min(k, self._cap - tail)
+                self._buf[tail:tail + first] = items[start:start + first]
+                if first < k:
+                    self._buf[:k - first] = items[start + first:start + k]
+                    tail = k - first
                 else:
-                    remaining = end_time - time.monotonic()
-                    if remaining <= 0:
-                        raise TimeoutError("get() timed out waiting for item")
-                    self._not_empty.wait(timeout=remaining)
-            item = self._queue.popleft()
-            self._not_full.notify()
-            return item
+                    tail += k
+                    if tail == self._cap:
+                        tail = 0
+                self._tail = tail
+                self._count += k
+                start += k
+
+            if self._waiting_getters:
+                self._not_empty.notify_all()
+
+    def get_many(
+        self, max_n: int, timeout: float | None = None, until: object = _UNSET
+    ) -> List[T]:
+        # With `until`, the batch ends right after the first item that `is
+        # until`, so anything queued behind it (e.g. items meant for another
+        # consumer after a sentinel) stays in the queue.
+        if max_n <= 0:
+            raise ValueError("max_n must be greater than 0")
+
+        with self._not_empty:
+            if self._count == 0:
+                self._waiting_getters += 1
+                try:
+                    if not self._not_empty.wait_for(self._has_items, timeout):
+                        raise TimeoutError("get_many() timed out waiting for item")
+                finally:
+                    self._waiting_getters -= 1
+            count = min(max_n, self._count)
+            head = self._head
+            end = head + count
+            if end <= self._cap:
+                batch = self._buf[head:end]
+            else:
+                batch = self._buf[head:] + self._buf[:end - self._cap]
+            if until is not _UNSET:
+                stop = _index_of(cast(List[object], batch), until)
+                if stop >= 0:
+                    count = stop + 1
+                    del batch[count:]
+                    end = head + count
 
+            if end <= self._cap:
+                self._buf[head:end] = [None] * count
+                if end == self._cap:
+                    end = 0
+            else:
+                end -= self._cap
+                self._buf[head:] = [None] * (self._cap - head)
+                self._buf[:end] = [None] * end
+            self._head = end
+            self._count -= count
+            if self._waiting_putters:
+                self._not_full.notify(count)
+            return cast(List[T], batch)
+
+    # Wait predicates for Condition.wait_for(), which re-checks them after
+    # every wakeup and tracks the remaining timeout itself.
+    def _has_space(self) -> bool:
+        return self._count < self.max_size
+
+    def _has_items(self) -> bool:
+        return self._count > 0
+
+    def _grow(self, min_capacity: int) -> None:
+        new_cap = self._cap * 2
+        while new_cap < min_capacity:
+            new_cap *= 2
+
+        end = self._head + self._count
+        if end <= self._cap:
+            items = self._buf[self._head:end]
+        else:
+            items = self._buf[self._head:] + self._buf[:end - self._cap]
+        self._buf = items + [None] * (new_cap - self._count)
+        self._head = 0
+        self._tail = self._count
+        self._cap = new_cap
+
+    # The state helpers below are point-in-time snapshots that may be stale as
+    # soon as they return, so they read the item count without taking the lock
+    # rather than serializing against producers and consumers.
     def size(self) -> int:
-        with self._lock:
-            return len(self._queue)
-    
+        return self._count
+
+    # For unbounded queues this is the current buffer size, which grows as
+    # needed; is_full() is always False there.
     def capacity(self) -> int:
-        return self.max_size
-    
+        return self._cap
+
     def is_empty(self) -> bool:
-        with self._lock:
-            return len(self._queue) == 0
-    
+        return self._count == 0
+
     def is_full(self) -> bool:
-        with self._lock:
-            return len(self._queue) >= self.max_size
+        return not self.unbounded and self._count == self.max_size
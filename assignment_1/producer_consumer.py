@@ -8,22 +8,34 @@ T = TypeVar("T")
 
 SENTINEL = object()
 
+
 @dataclass(kw_only=True, eq=False)
 class Producer(threading.Thread, Generic[T]):
     source: Iterable[T]
     queue: BlockingQueue[object]
     sentinel: object = SENTINEL
     name: str = "producer"
+    # Items are held back until a full batch is ready; None means half the
+    # queue capacity. Use 1 for slow or streaming sources.
+    batch_size: int | None = None
     
     def __post_init__(self) -> None:
+        if self.batch_size is not None and self.batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
         threading.Thread.__init__(self, name=self.name)
     
     def run(self) -> None:
+        batch_size = self.batch_size or max(1, self.queue.capacity() // 2)
+        batch: List[object] = []
         try:
             for item in self.source:
-                self.queue.put(item)
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    self.queue.put_many(batch)
+                    batch = []
         finally:
-            self.queue.put(self.sentinel)
+            batch.append(self.sentinel)
+            self.queue.put_many(batch)
 
 
 @dataclass(kw_only=True, eq=False)
@@ -37,14 +49,17 @@ class Consumer(threading.Thread, Generic[T]):
         threading.Thread.__init__(self, name=self.name)
         
     def run(self) -> None:
+        batch_size = self.queue.capacity()
         while True:
-            item = self.queue.get()
-            
-            if item is self.sentinel:
+            # The batch stops at our sentinel, so items queued behind it are
+            # left for other consumers in FIFO order.
+            batch = self.queue.get_many(batch_size, until=self.sentinel)
+
+            if batch[-1] is self.sentinel:
+                self.destination.extend(cast(List[T], batch[:-1]))
                 break
-            
-            value = cast(T, item)
-            self.destination.append(value)
+
+            self.destination.extend(cast(List[T], batch))
 
 
 def run_pipeline(source: Iterable[T], queue_size: int=10) -> List[T]:
@@ -88,4 +88,161 @@ def test_queue_blocks_put_when_full_until_space_avilable() -> None:
     t.join(timeout=1.0)
     assert blocked["value"] is False
     assert queue.get() == 20
-    assert queue.is_empty() is True
\ No newline at end of file
+    assert queue.is_empty() is True
+
+
+def test_queue_put_many_and_get_many_basic() -> None:
+    queue = BlockingQueue[int](max_size=5)
+    queue.put_many([1, 2, 3])
+
+    assert queue.size() == 3
+    assert queue.get_many(2) == [1, 2]
+    assert queue.get_many(10) == [3]
+    assert queue.is_empty() is True
+
+
+def test_queue_put_many_larger_than_capacity_waits_for_space() -> None:
+    queue: BlockingQueue[int] = BlockingQueue(max_size=2)
+    result: list[int] = []
+
+    def consumer() -> None:
+        while len(result) < 5:
+            result.extend(queue.get_many(2, timeout=1.0))
+
+    t = threading.Thread(target=consumer)
+    t.start()
+
+    queue.put_many([1, 2, 3, 4, 5], timeout=1.0)
+
+    t.join(timeout=1.0)
+    assert not t.is_alive()
+    assert result == [1, 2, 3, 4, 5]
+    assert queue.is_empty() is True
+
+
+def test_queue_put_many_timeout_keeps_items_already_enqueued() -> None:
+    queue = BlockingQueue[int](max_size=2)
+    with pytest.raises(TimeoutError, match="after enqueuing 2 of 3 items"):
+        queue.put_many([1, 2, 3], timeout=0.05)
+
+    assert queue.get_many(10) == [1, 2]
+
+
+def test_queue_get_many_times_out_when_empty() -> None:
+    queue = BlockingQueue[int](max_size=2)
+    with pytest.raises(TimeoutError):
+        queue.get_many(2, timeout=0.05)
+    with pytest.raises(ValueError):
+        queue.get_many(0)
+
+
+def test_queue_preserves_fifo_order_across_wraparound() -> None:
+    queue = BlockingQueue[int](max_size=3)
+    expected: list[int] = []
+    result: list[int] = []
+
+    for i in range(10):
+        queue.put(i)
+        expected.append(i)
+        if queue.is_full():
+            result.append(queue.get())
+    result.append(queue.get())
+    queue.put_many([10, 11])
+    expected.extend([10, 11])
+
+    while not queue.is_empty():
+        result.append(queue.get())
+
+    assert result == expected
+
+
+def test_queue_wakes_blocked_producers_and_consumers() -> None:
+    queue: BlockingQueue[int] = BlockingQueue(max_size=1)
+    result: list[int] = []
+    lock = threading.Lock()
+
+    def producer(start: int) -> None:
+        for i in range(start, start + 50):
+            queue.put(i, timeout=1.0)
+
+    def consumer() -> None:
+        for _ in range(50):
+            item = queue.get(timeout=1.0)
+            with lock:
+                result.append(item)
+
+    threads = [threading.Thread(target=producer, args=(0,)),
+               threading.Thread(target=producer, args=(50,)),
+               threading.Thread(target=consumer),
+               threading.Thread(target=consumer)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=2.0)
+        assert not t.is_alive()
+
+    assert sorted(result) == list(range(100))
+    assert queue.is_empty() is True
+
+
+def test_unbounded_queue_grows_without_blocking() -> None:
+    queue = BlockingQueue[int](max_size=2, unbounded=True)
+    queue.put(0)
+    queue.put(1)
+    assert queue.get() == 0
+
+    # Wrapped buffer is unrolled in FIFO order when it grows.
+    for i in range(2, 6):
+        queue.put(i, timeout=0.01)
+    queue.put_many([6, 7, 8, 9, 10], timeout=0.01)
+
+    assert queue.size() == 10
+    assert queue.is_full() is False
+    assert queue.capacity() == 16
+    assert queue.get_many(20) == list(range(1, 11))
+    assert queue.is_empty() is True
+
+
+def test_queue_put_and_get_time_out() -> None:
+    queue = BlockingQueue[int](max_size=1)
+    with pytest.raises(TimeoutError):
+        queue.get(timeout=0.05)
+
+    queue.put(1)
+    with pytest.raises(TimeoutError):
+        queue.put(2, timeout=0.05)
+
+    assert queue.get(timeout=0.05) == 1
+
+
+def test_queue_batched_ops_preserve_fifo_across_wraparound() -> None:
+    queue = BlockingQueue[int](max_size=5)
+    expected: list[int] = []
+    result: list[int] = []
+    next_item = 0
+
+    # Batch sizes chosen so that puts and gets straddle the end of the buffer.
+    for put_n, get_n in [(3, 2), (4, 3), (2, 4), (5, 5), (1, 1), (4, 2), (3, 10)]:
+        put_n = min(put_n, queue.capacity() - queue.size())
+        batch = list(range(next_item, next_item + put_n))
+        next_item += put_n
+        queue.put_many(batch, timeout=0.05)
+        expected.extend(batch)
+        result.extend(queue.get_many(get_n, timeout=0.05))
+
+    while not queue.is_empty():
+        result.extend(queue.get_many(2, timeout=0.05))
+
+    assert result == expected
+    assert queue._buf == [None] * queue.capacity()
+
+
+def test_queue_get_many_until_stops_after_marker() -> None:
+    queue: BlockingQueue[object] = BlockingQueue(max_size=6)
+    marker = object()
+    queue.put_many([1, marker, 2, marker])
+
+    assert queue.get_many(10, until=marker) == [1, marker]
+    assert queue.get_many(1, until=marker) == [2]
+    assert queue.get_many(10, until=marker) == [marker]
+    assert queue.is_empty() is True
@@ -1,5 +1,7 @@
 import sys
+import threading
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
@@ -69,3 +71,56 @@ def test_run_pipeline_preserves_none_values() -> None:
     source: list[int | None] = [1, None, 3]
     result = run_pipeline(source, queue_size=2)
     assert result == [1, None, 3]
+
+
+def test_consumer_leaves_items_after_its_sentinel_in_queue() -> None:
+    queue: BlockingQueue[object] = BlockingQueue(max_size=4)
+    destination: list[int] = []
+
+    queue.put_many([SENTINEL, 2, 3, SENTINEL])
+
+    consumer: Consumer[int] = Consumer(queue=queue, destination=destination)
+    consumer.start()
+    consumer.join(timeout=1.0)
+
+    assert destination == []
+    assert queue.get_many(10) == [2, 3, SENTINEL]
+    assert queue.is_empty() is True
+
+
+def test_producer_batch_size_one_forwards_each_item() -> None:
+    queue: BlockingQueue[object] = BlockingQueue(max_size=10)
+    release = threading.Event()
+
+    def source() -> Iterator[int]:
+        yield 1
+        release.wait(timeout=1.0)
+        yield 2
+
+    producer: Producer[int] = Producer(source=source(), queue=queue, batch_size=1)
+    producer.start()
+
+    # The first item arrives while the source is still blocked.
+    assert queue.get(timeout=1.0) == 1
+    assert producer.is_alive()
+
+    release.set()
+    producer.join(timeout=1.0)
+    assert queue.get_many(10, timeout=1.0) == [2, SENTINEL]
+    with pytest.raises(ValueError):
+        Producer(source=[1], queue=queue, batch_size=0)
+
+
+def test_consumer_batches_stop_at_sentinel() -> None:
+    queue: BlockingQueue[object] = BlockingQueue(max_size=4)
+    destination: list[int] = []
+
+    queue.put_many([1, 2, SENTINEL, 3])
+
+    consumer: Consumer[int] = Consumer(queue=queue, destination=destination)
+    consumer.start()
+    consumer.join(timeout=1.0)
+
+    assert not consumer.is_alive()
+    assert destination == [1, 2]
+    assert queue.get_many(10) == [3]
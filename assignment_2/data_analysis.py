@@ -1,13 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from os import PathLike
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from decimal import Decimal
 from enum import StrEnum
 from collections import defaultdict
+from itertools import starmap
+from operator import attrgetter, itemgetter, mul
 
 import csv
+import heapq
+import sys
 
 
 class Category(StrEnum):
@@ -16,7 +20,10 @@ class Category(StrEnum):
     SUBSCRIPTION = "subscription"
 
 
-REQUIRED_COLUMNS = {
+# Plain dict lookup is much cheaper than calling Category(value) per row.
+_CATEGORY_MAP: dict[str, Category] = {c.value: c for c in Category}
+
+REQUIRED_COLUMNS = frozenset({
     "transaction_id",
     "timestamp",
     "user_id",
@@ -24,12 +31,12 @@ REQUIRED_COLUMNS = {
     "item",
     "quantity",
     "unit_price",
-}
+})
 
 PathTypes = str | Path | PathLike[str]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TransactionRecord:
     transaction_id: str
     timestamp: datetime
@@ -38,11 +45,52 @@ class TransactionRecord:
     item: str
     quantity: int
     unit_price: Decimal
+    # Aggregations accumulate exact integer cents and only convert back to
+    # Decimal at the boundary, which is much cheaper than Decimal arithmetic.
+    unit_price_cents: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        cents = self.unit_price.scaleb(2)
+        if not cents.is_finite():
+            raise ValueError(f"unit_price {self.unit_price} is not a finite number")
+        if cents != cents.to_integral_value():
+            raise ValueError(
+                f"unit_price {self.unit_price} has more than two decimal places"
+            )
+        object.__setattr__(self, "unit_price_cents", int(cents))
 
     @property
     def revenue(self) -> Decimal:
         return self.quantity * self.unit_price
 
+    @property
+    def revenue_cents(self) -> int:
+        return self.quantity * self.unit_price_cents
+
+
+def _cents_to_decimal(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def _average_cents(total: int, count: int) -> Decimal:
+    return (Decimal(total) / count).scaleb(-2).quantize(Decimal("0.01"))
+
+
+def _top_n(item_totals: dict[str, int], n: int) -> list[tuple[str, Decimal]]:
+    # O(M log n) and ties keep insertion order, same as a stable sort + slice.
+    top_items = heapq.nlargest(n, item_totals.items(), key=itemgetter(1))
+    return [(item, _cents_to_decimal(cents)) for item, cents in top_items]
+
+
+@dataclass(frozen=True, kw_only=True)
+class AggregateResult:
+    transaction_count: int
+    total_revenue: Decimal
+    revenue_by_category: dict[Category, Decimal]
+    revenue_by_user: dict[str, Decimal]
+    average_revenue_per_user: dict[str, Decimal]
+    top_items: list[tuple[str, Decimal]]
+
 
 def _parse_timestamp(time_stamp: str) -> datetime:
     if time_stamp.endswith("Z"):
@@ -50,136 +98,206 @@ def _parse_timestamp(time_stamp: str) -> datetime:
     return datetime.fromisoformat(time_stamp)
 
 
-def _load_transactions(path: PathTypes) -> list[TransactionRecord]:
+def iter_transactions(path: PathTypes) -> Iterator[TransactionRecord]:
+    # Streams records one row at a time so callers such as compute_all() keep
+    # memory flat. Being a generator, file and header errors are raised on
+    # the first next() rather than at call time.
     csv_path = Path(path)
 
     if not csv_path.is_file():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
     with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
 
-        if reader.fieldnames is None:
+        header = next(reader, None)
+        if header is None:
             raise ValueError(f"CSV file {csv_path} has no header row")
 
-        missing = REQUIRED_COLUMNS - set(reader.fieldnames)
+        missing = REQUIRED_COLUMNS.difference(header)
         if missing:
             raise ValueError(
                 f"CSV file {csv_path} is missing required columns: {sorted(missing)}"
             )
 
-        records: list[TransactionRecord] = []
+        # A repeated required column would make the positional lookup below
+        # ambiguous, so refuse it instead of silently picking one.
+        duplicated = sorted(c for c in REQUIRED_COLUMNS if header.count(c) > 1)
+        if duplicated:
+            raise ValueError(
+                f"CSV file {csv_path} has duplicate required columns: {duplicated}"
+            )
+
+        # Index rows by column position rather than building a dict per row.
+        idx_tid = header.index("transaction_id")
+        idx_ts = header.index("timestamp")
+        idx_user = header.index("user_id")
+        idx_cat = header.index("category")
+        idx_item = header.index("item")
+        idx_qty = header.index("quantity")
+        idx_price = header.index("unit_price")
+        min_width = max(idx_tid, idx_ts, idx_user, idx_cat, idx_item, idx_qty, idx_price) + 1
+
         for idx, row in enumerate(reader, start=2):
-            category_value = row["category"]
-            try:
-                category = Category(category_value)
-            except ValueError as exc:
+            if not row:
+                continue
+            if len(row) < min_width:
+                raise ValueError(
+                    f"Row {idx} of {csv_path} has {len(row)} fields, "
+                    f"expected at least {min_width}"
+                )
+
+            category_value = row[idx_cat]
+            category = _CATEGORY_MAP.get(category_value)
+            if category is None:
                 raise ValueError(
                     f"Unknown category '{category_value}' in row {idx} of {csv_path}"
-                ) from exc
-
-            record = TransactionRecord(
-                transaction_id=row["transaction_id"],
-                timestamp=_parse_timestamp(row["timestamp"]),
-                user_id=row["user_id"],
-                category=category,
-                item=row["item"],
-                quantity=int(row["quantity"]),
-                unit_price=Decimal(row["unit_price"]),
-            )
-            records.append(record)
+                )
+
+            try:
+                record = TransactionRecord(
+                    transaction_id=row[idx_tid],
+                    timestamp=_parse_timestamp(row[idx_ts]),
+                    user_id=sys.intern(row[idx_user]),
+                    category=category,
+                    item=sys.intern(row[idx_item]),
+                    quantity=int(row[idx_qty]),
+                    unit_price=Decimal(row[idx_price]),
+                )
+            except ValueError as exc:
+                raise ValueError(f"{exc} in row {idx} of {csv_path}") from exc
+            yield record
+
+
+def _load_transactions(path: PathTypes) -> list[TransactionRecord]:
+    return list(iter_transactions(path))
 
-    return records
+
+# Aggregation loops multiply these fields inline instead of going through
+# the revenue_cents property, saving a Python call per record.
+_quantity_and_price_cents = attrgetter("quantity", "unit_price_cents")
 
 
 def total_revenue(records: Iterable[TransactionRecord]) -> Decimal:
-    return sum((r.revenue for r in records), start=Decimal("0"))
+    return _cents_to_decimal(
+        sum(starmap(mul, map(_quantity_and_price_cents, records)))
+    )
 
 
 def revenue_for_category(
     records: Iterable[TransactionRecord], category: Category
 ) -> Decimal:
-    return sum(
-        (r.revenue for r in records if r.category is category),
-        start=Decimal("0"),
+    return _cents_to_decimal(
+        sum(
+            r.quantity * r.unit_price_cents
+            for r in records
+            if r.category is category
+        )
     )
     
 
 def revenue_by_category(records: Iterable[TransactionRecord]) -> dict[Category, Decimal]:
-    totals: dict[Category, Decimal] = defaultdict(lambda: Decimal("0"))
+    totals: dict[Category, int] = defaultdict(int)
     for r in records:
-        totals[r.category] += r.revenue
-    return dict(totals)
+        totals[r.category] += r.quantity * r.unit_price_cents
+    return {cat: _cents_to_decimal(cents) for cat, cents in totals.items()}
 
 
 def revenue_by_user(records: Iterable[TransactionRecord]) -> dict[str, Decimal]:
-    totals: dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+    totals: dict[str, int] = defaultdict(int)
     for r in records:
-        totals[r.user_id] += r.revenue
-    return dict(totals)
+        totals[r.user_id] += r.quantity * r.unit_price_cents
+    return {user: _cents_to_decimal(cents) for user, cents in totals.items()}
 
 
 def top_n_items_by_revenue(
     records: Iterable[TransactionRecord],
     n: int = 3,
 ) -> list[tuple[str, Decimal]]:
-    item_totals: dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+    item_totals: dict[str, int] = defaultdict(int)
     for r in records:
-        item_totals[r.item] += r.revenue
+        item_totals[r.item] += r.quantity * r.unit_price_cents
 
-    sorted_items = sorted(
-        item_totals.items(),
-        key=lambda kv: kv[1],
-        reverse=True,
-    )
-    return sorted_items[:n]
+    return _top_n(item_totals, n)
 
 
 def average_revenue_per_user(records: Iterable[TransactionRecord]) -> dict[str, Decimal]:
-    totals: dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+    totals: dict[str, int] = defaultdict(int)
     counts: dict[str, int] = defaultdict(int)
 
     for r in records:
-        totals[r.user_id] += r.revenue
+        totals[r.user_id] += r.quantity * r.unit_price_cents
         counts[r.user_id] += 1
 
-    return {
-        user: (totals[user] / counts[user]).quantize(Decimal("0.01"))
-        for user in totals
-    }
+    return {user: _average_cents(totals[user], counts[user]) for user in totals}
+
+
+def compute_all(
+    records: Iterable[TransactionRecord],
+    top_n: int = 3,
+) -> AggregateResult:
+    # Single pass over the records computing every aggregate main() reports,
+    # instead of one pass per analysis function.
+    count = 0
+    total = 0
+    by_category: dict[Category, int] = defaultdict(int)
+    by_user: dict[str, int] = defaultdict(int)
+    user_counts: dict[str, int] = defaultdict(int)
+    by_item: dict[str, int] = defaultdict(int)
+
+    for r in records:
+        cents = r.quantity * r.unit_price_cents
+        count += 1
+        total += cents
+        by_category[r.category] += cents
+        by_user[r.user_id] += cents
+        user_counts[r.user_id] += 1
+        by_item[r.item] += cents
+
+    return AggregateResult(
+        transaction_count=count,
+        total_revenue=_cents_to_decimal(total),
+        revenue_by_category={
+            cat: _cents_to_decimal(cents) for cat, cents in by_category.items()
+        },
+        revenue_by_user={
+            user: _cents_to_decimal(cents) for user, cents in by_user.items()
+        },
+        average_revenue_per_user={
+            user: _average_cents(by_user[user], user_counts[user]) for user in by_user
+        },
+        top_items=_top_n(by_item, top_n),
+    )
 
 
 def main() -> None:
     csv_path = Path(__file__).resolve().parent / "data" / "transactions.csv"
-    records = _load_transactions(csv_path)
+    result = compute_all(iter_transactions(csv_path), top_n=3)
 
     print("=== Assignment 2: Transaction Analysis ===")
-    print(f"Loaded {len(records)} transactions from {csv_path.name}\n")
+    print(f"Loaded {result.transaction_count} transactions from {csv_path.name}\n")
 
-    total = total_revenue(records)
-    print(f"Total revenue: {total}")
+    print(f"Total revenue: {result.total_revenue}")
 
-    by_cat = revenue_by_category(records)
     print("\nRevenue by category:")
-    for cat, value in by_cat.items():
+    for cat, value in result.revenue_by_category.items():
         print(f"  {cat.value}: {value}")
 
-    physical_total = revenue_for_category(records, Category.PHYSICAL)
+    physical_total = result.revenue_by_category.get(
+        Category.PHYSICAL, _cents_to_decimal(0)
+    )
     print(f"\nRevenue for PHYSICAL only: {physical_total}")
 
-    by_user = revenue_by_user(records)
     print("\nRevenue by user:")
-    for user_id, value in by_user.items():
+    for user_id, value in result.revenue_by_user.items():
         print(f"  {user_id}: {value}")
 
-    avg_by_user = average_revenue_per_user(records)
     print("\nAverage revenue per user:")
-    for user_id, value in avg_by_user.items():
+    for user_id, value in result.average_revenue_per_user.items():
         print(f"  {user_id}: {value}")
 
-    top_items = top_n_items_by_revenue(records, n=3)
     print("\nTop 3 items by revenue:")
-    for item, value in top_items:
+    for item, value in result.top_items:
         print(f"  {item}: {value}")
 
 
@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
@@ -9,12 +10,15 @@ sys.path.insert(0, str(REPO_ROOT))
 
 from assignment_2.data_analysis import (
     _load_transactions,
+    iter_transactions,
     total_revenue,
     revenue_for_category,
     revenue_by_category,
     revenue_by_user,
     top_n_items_by_revenue,
     average_revenue_per_user,
+    compute_all,
+    AggregateResult,
     TransactionRecord,
     Category,
 )
@@ -43,6 +47,7 @@ def test_load_transactions_parses_rows() -> None:
     assert first.timestamp.year == 2025
     assert first.timestamp.month == 1
     assert first.timestamp.tzinfo is not None
+    assert not hasattr(first, "__dict__")
 
 
 def test_total_revenue_matches_manual_sum() -> None:
@@ -160,3 +165,155 @@ def test_load_transactions_unknown_category_raises(tmp_path: Path) -> None:
         _ = _load_transactions(bad_csv)
 
     assert "Unknown category" in str(excinfo.value)
+
+
+def test_record_revenue_cents_matches_decimal_revenue() -> None:
+    records = _load_transactions(_get_csv_path())
+
+    for r in records:
+        assert r.revenue_cents == int(r.revenue * 100)
+
+    assert records[0].unit_price_cents == 499
+
+
+def test_record_rejects_sub_cent_unit_price() -> None:
+    with pytest.raises(ValueError) as excinfo:
+        _ = TransactionRecord(
+            transaction_id="T1",
+            timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            user_id="U001",
+            category=Category.DIGITAL,
+            item="Something",
+            quantity=1,
+            unit_price=Decimal("0.995"),
+        )
+
+    assert "more than two decimal places" in str(excinfo.value)
+
+
+def test_compute_all_matches_individual_aggregations() -> None:
+    records = _load_transactions(_get_csv_path())
+
+    result = compute_all(records, top_n=3)
+
+    assert isinstance(result, AggregateResult)
+    assert result.transaction_count == 5
+    assert result.total_revenue == total_revenue(records)
+    assert result.revenue_by_category == revenue_by_category(records)
+    assert result.revenue_by_user == revenue_by_user(records)
+    assert result.average_revenue_per_user == average_revenue_per_user(records)
+    assert result.top_items == top_n_items_by_revenue(records, n=3)
+
+
+def test_compute_all_on_empty_iterable() -> None:
+    result = compute_all([])
+
+    assert result.total_revenue == Decimal("0")
+    assert result.revenue_by_category == {}
+    assert result.top_items == []
+
+
+def test_top_n_items_by_revenue_keeps_first_seen_order_on_ties(tmp_path: Path) -> None:
+    csv_path = tmp_path / "ties.csv"
+    csv_path.write_text(
+        "transaction_id,timestamp,user_id,category,item,quantity,unit_price\n"
+        "T1,2025-01-01T00:00:00Z,U001,digital,Alpha,1,2.00\n"
+        "T2,2025-01-01T00:00:00Z,U001,digital,Beta,2,1.00\n"
+        "T3,2025-01-01T00:00:00Z,U001,digital,Gamma,1,3.00\n",
+        encoding="utf-8",
+    )
+    records = _load_transactions(csv_path)
+
+    assert top_n_items_by_revenue(records, n=2) == [
+        ("Gamma", Decimal("3.00")),
+        ("Alpha", Decimal("2.00")),
+    ]
+
+
+def test_iter_transactions_streams_into_compute_all() -> None:
+    stream = iter_transactions(_get_csv_path())
+
+    first = next(stream)
+    assert first.transaction_id == "T1001"
+
+    result = compute_all(stream)
+    assert result.transaction_count == 4
+    assert result.total_revenue == Decimal("33.83") - first.revenue
+
+
+def test_load_transactions_by_column_name_not_position(tmp_path: Path) -> None:
+    csv_path = tmp_path / "reordered.csv"
+    csv_path.write_text(
+        "unit_price,quantity,item,category,user_id,timestamp,transaction_id,note\n"
+        "1.25,2,Sticker,physical,U009,2025-01-01T00:00:00Z,T1,extra\n"
+        "\n"
+        "3.00,1,Theme,digital,U009,2025-01-02T00:00:00Z,T2,extra\n",
+        encoding="utf-8",
+    )
+
+    records = _load_transactions(csv_path)
+
+    assert [r.transaction_id for r in records] == ["T1", "T2"]
+    assert records[0].item == "Sticker"
+    assert records[0].revenue == Decimal("2.50")
+    assert records[1].category is Category.DIGITAL
+
+
+def test_load_transactions_short_row_raises(tmp_path: Path) -> None:
+    bad_csv = tmp_path / "short_row.csv"
+    bad_csv.write_text(
+        "transaction_id,timestamp,user_id,category,item,quantity,unit_price\n"
+        "T1,2025-01-01T00:00:00Z,U001,digital\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        _ = _load_transactions(bad_csv)
+
+    assert "Row 2" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("price", ["Infinity", "NaN"])
+def test_record_rejects_non_finite_unit_price(price: str) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        _ = TransactionRecord(
+            transaction_id="T1",
+            timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            user_id="U001",
+            category=Category.DIGITAL,
+            item="Something",
+            quantity=1,
+            unit_price=Decimal(price),
+        )
+
+    assert "not a finite number" in str(excinfo.value)
+
+
+def test_load_transactions_bad_unit_price_reports_row(tmp_path: Path) -> None:
+    bad_csv = tmp_path / "bad_price.csv"
+    bad_csv.write_text(
+        "transaction_id,timestamp,user_id,category,item,quantity,unit_price\n"
+        "T1,2025-01-01T00:00:00Z,U001,digital,Something,1,1.00\n"
+        "T2,2025-01-01T00:00:00Z,U001,digital,Something,1,1.005\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        _ = _load_transactions(bad_csv)
+
+    assert "more than two decimal places" in str(excinfo.value)
+    assert f"row 3 of {bad_csv}" in str(excinfo.value)
+
+
+def test_load_transactions_duplicate_required_column_raises(tmp_path: Path) -> None:
+    bad_csv = tmp_path / "duplicate_column.csv"
+    bad_csv.write_text(
+        "transaction_id,timestamp,user_id,category,item,quantity,unit_price,quantity\n"
+        "T1,2025-01-01T00:00:00Z,U001,digital,Something,1,1.00,2\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        _ = _load_transactions(bad_csv)
+
+    assert "duplicate required columns: ['quantity']" in str(excinfo.value)